@@ -4,9 +4,12 @@ Argument parser
 
 import argparse
 import configparser
+import math
 import sys
 from pathlib import Path
 
+from utils import JIRA_CONFIG
+
 def prompt_for_value(arg_name: str, description: str, default_value: str | None = None) -> str:
     """Prompt user for a missing argument value with optional default"""
     if default_value is not None:
@@ -28,6 +31,28 @@ def prompt_for_value(arg_name: str, description: str, default_value: str | None
         sys.exit(1)
 
 
+def positive_int(value: str) -> int:
+    """Argument type for options that must be a whole number greater than zero"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid positive integer: {value!r}") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than zero: {value!r}")
+    return number
+
+
+def positive_float(value: str) -> float:
+    """Argument type for options that must be a number greater than zero"""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid positive number: {value!r}") from None
+    if math.isnan(number) or number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than zero: {value!r}")
+    return number
+
+
 def load_config():
     """Load configuration from config.txt file if it exists"""
     config_file = Path('config.txt')
@@ -75,6 +100,18 @@ def parse_args_interactive():
                         dest='proxy',
                         help='If a proxy is to be used to reach out to JIRA')
 
+    parser.add_argument('-c', '--concurrency',
+                        dest='concurrency',
+                        default=JIRA_CONFIG['DEFAULT_CONCURRENCY'],
+                        type=positive_int,
+                        help=f"Maximum number of concurrent requests to JIRA (default: {JIRA_CONFIG['DEFAULT_CONCURRENCY']})")
+
+    parser.add_argument('-r', '--rate-limit',
+                        dest='rate_limit',
+                        default=JIRA_CONFIG['DEFAULT_RATE_LIMIT'],
+                        type=positive_float,
+                        help='Maximum number of requests per second sent to JIRA (default: unlimited)')
+
     parser.add_argument('-u', '--url',
                         dest='url',
                         required=url_from_config is None,  # Only required if no config url
@@ -5,7 +5,6 @@ Main Excel exporter class - orchestrates all export operations
 import os
 from typing import Optional, Tuple, Union
 
-import numpy
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.styles import Font
@@ -179,14 +178,14 @@ class ExcelExporter:
         cycle_data: list[list[Union[str, int]]] = [["Issue Type", "Count", "Average", "Top 1%", "Bottom 1%", "Std Deviation"]]
         
         for issue_type, items in self.state.cycle_time_per_type.items():
-            values = numpy.array([item[1] for item in items])
+            stats = self.state.get_cycle_time_stats(items)
             cycle_data.append([
                 issue_type,
-                len(items),
-                seconds_to_pretty(float(numpy.mean(values))),
-                seconds_to_pretty(float(numpy.percentile(values, 99))),
-                seconds_to_pretty(float(numpy.percentile(values, 1))),
-                seconds_to_pretty(float(numpy.std(values)))
+                stats['count'],
+                seconds_to_pretty(stats['average']),
+                seconds_to_pretty(stats['top_1']),
+                seconds_to_pretty(stats['bottom_1']),
+                seconds_to_pretty(stats['std_dev'])
             ])
         
         return self.table_writer.write_data_table(ws, row, cycle_data)
@@ -200,14 +199,13 @@ class ExcelExporter:
                                key=lambda x: float('inf') if x == -1 else x)
         
         for sp_key in sorted_sp_keys:
-            items = self.state.cycle_time_per_sp[sp_key]
-            values = numpy.array([item[1] for item in items])
+            stats = self.state.get_cycle_time_stats(self.state.cycle_time_per_sp[sp_key])
             sp_display = f"{sp_key} SPs" if sp_key != -1 else "No SPs"
             sp_data.append([
                 sp_display,
-                len(items),
-                seconds_to_pretty(float(numpy.mean(values))),
-                seconds_to_pretty(float(numpy.std(values)))
+                stats['count'],
+                seconds_to_pretty(stats['average']),
+                seconds_to_pretty(stats['std_dev'])
             ])
         
         return self.table_writer.write_data_table(ws, row, sp_data)
@@ -217,16 +215,14 @@ class ExcelExporter:
         row = self.table_writer.write_section_header(ws, row, "Work Item Aging")
         
         if not self.state.aging_items:
-            ws[f'A{row}'] = "No items currently in progress"
-            ws[f'A{row}'].font = self.styles.italic_font
-            return row + 1
+            return self.table_writer.write_note(ws, row, "No items currently in progress")
         
         aged_items = [item for item in self.state.aging_items if item['is_aged']]
         
         if not aged_items:
-            ws[f'A{row}'] = f"No aged items found ({len(self.state.aging_items)} items in progress)"
-            ws[f'A{row}'].font = self.styles.italic_font
-            return row + 1
+            return self.table_writer.write_note(
+                ws, row, f"No aged items found ({len(self.state.aging_items)} items in progress)"
+            )
         
         aging_data: list[list[Union[str, int, StatusLabel]]] = [["Issue Key", "Type", "Days In Progress", "Threshold", "Status"]]
         
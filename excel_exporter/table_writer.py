@@ -2,7 +2,7 @@
 Table writing utilities for Excel sheets
 """
 
-from typing import Sequence, Union
+from typing import Dict, Optional, Sequence, Union
 
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.styles import Alignment
@@ -11,12 +11,34 @@ from openpyxl.utils import get_column_letter
 from utils import StatusLabel
 from .styles import ExcelStyles
 
+_BODY_ALIGN = Alignment(horizontal='left', vertical='center')
+
 
 class TableWriter:
     """Handles writing data tables to Excel worksheets"""
     
     def __init__(self, styles: ExcelStyles):
         self.styles = styles
+        self.status_fills = {
+            StatusLabel.GOOD: styles.good_fill,
+            StatusLabel.WARNING: styles.warning_fill,
+            StatusLabel.POOR: styles.bad_fill,
+            StatusLabel.AGED: styles.bad_fill
+        }
+        # Longest value written per sheet and column, consumed by autosize_columns
+        self.max_widths: Dict[str, Dict[int, int]] = {}
+    
+    def _track_width(self, ws: Worksheet, column: int, value: Optional[Union[str, int, float]]) -> None:
+        """Record the display length of a value written to a column"""
+        widths = self.max_widths.setdefault(ws.title, {})
+        length = len(str(value)) if value else 0
+        widths[column] = max(widths.get(column, 0), length)
+    
+    def _track_merged_width(self, ws: Worksheet, title: str) -> None:
+        """Record a title merged across columns A to D"""
+        self._track_width(ws, 1, title)
+        for column in range(2, 5):
+            self._track_width(ws, column, None)
     
     def write_data_table(self, ws: Worksheet, start_row: int, 
                         data: Sequence[Sequence[Union[str, int, float, StatusLabel]]], 
@@ -24,30 +46,29 @@ class TableWriter:
         """Write a data table with headers and return next available row"""
         for row_idx, row_data in enumerate(data):
             current_row = start_row + row_idx
+            is_header = row_idx == 0
+            status_col = len(row_data) - 1 if apply_status_coloring and not is_header else -1
             
             for col_idx, value in enumerate(row_data):
-                col_letter = get_column_letter(col_idx + 1)
-                cell = ws[f'{col_letter}{current_row}']
+                cell = ws.cell(row=current_row, column=col_idx + 1)
                 
                 if isinstance(value, StatusLabel):
                     cell.value = value.value
                 else:
                     cell.value = value
+                self._track_width(ws, col_idx + 1, cell.value)
                     
                 cell.border = self.styles.border
-                cell.alignment = Alignment(horizontal='left', vertical='center')
+                cell.alignment = _BODY_ALIGN
                 
-                if row_idx == 0:
+                if is_header:
                     cell.font = self.styles.header_font
                     cell.fill = self.styles.header_fill
                 
-                if apply_status_coloring and row_idx > 0 and col_idx == len(row_data) - 1:
-                    if value == StatusLabel.GOOD:
-                        cell.fill = self.styles.good_fill
-                    elif value == StatusLabel.WARNING:
-                        cell.fill = self.styles.warning_fill
-                    elif value in (StatusLabel.POOR, StatusLabel.AGED):
-                        cell.fill = self.styles.bad_fill
+                if col_idx == status_col:
+                    status_fill = self.status_fills.get(value)
+                    if status_fill is not None:
+                        cell.fill = status_fill
         
         return start_row + len(data)
     
@@ -59,6 +80,7 @@ class TableWriter:
         cell.font = self.styles.subheader_font
         cell.fill = self.styles.subheader_fill
         cell.alignment = Alignment(horizontal='left')
+        self._track_merged_width(ws, title)
         return row + 1
     
     def write_title(self, ws: Worksheet, title: str, row: int = 1) -> int:
@@ -68,20 +90,19 @@ class TableWriter:
         cell.value = title
         cell.font = self.styles.title_font
         cell.alignment = self.styles.title_alignment
+        self._track_merged_width(ws, title)
         return row + 2
     
+    def write_note(self, ws: Worksheet, row: int, text: str) -> int:
+        """Write an italic note in the first column and return next row"""
+        cell = ws.cell(row=row, column=1, value=text)
+        cell.font = self.styles.italic_font
+        self._track_width(ws, 1, text)
+        return row + 1
+    
     def autosize_columns(self, ws: Worksheet) -> None:
         """Auto-size all columns based on content"""
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column or 1)
-            
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        widths = self.max_widths.pop(ws.title, {})
+        for column in range(1, max(widths, default=0) + 1):
+            adjusted_width = min(widths.get(column, 0) + 2, 50)
+            ws.column_dimensions[get_column_letter(column)].width = adjusted_width
@@ -6,6 +6,7 @@ from .client import JiraTools
 from .models import IssueInfo, Event, StatusEvent, SprintEvent, IssueClassification
 from .classifier import IssueClassifier, IssueState
 from .debug import DebugManager
+from .rate_limiter import RateLimiter
 
 __all__ = [
     'JiraTools',
@@ -16,5 +17,6 @@ __all__ = [
     'IssueClassification',
     'IssueClassifier',
     'IssueState',
-    'DebugManager'
+    'DebugManager',
+    'RateLimiter'
 ]
\ No newline at end of file
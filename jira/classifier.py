@@ -2,17 +2,35 @@
 JIRA issue classification and state management logic
 """
 
-from datetime import datetime, timedelta, timezone
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
+from operator import attrgetter
+import sys
 from typing import Dict, List, Any, Optional
 
 from .models import Event, StatusEvent, SprintEvent, IssueClassification
+from .sprint_fields import parse_sprint_fields, split_sprints
 from utils import AGING_THRESHOLDS, JIRA_CONFIG
 
+# Target statuses that start or finish work: only their transitions record the sprint they happened in,
+# and issues never moved to one of them cannot be valid or aging, so they are skipped early
+_WORK_STATUSES = frozenset({"In Progress", "Resolved"})
+
+# Weekend days among the first N days (0-6) of a run starting on a given weekday (Monday=0)
+_PARTIAL_WEEK_WEEKEND_DAYS = [[sum(1 for i in range(n) if (weekday + i) % 7 >= 5) for n in range(7)]
+                              for weekday in range(7)]
 
 class IssueState:
     """State machine for tracking issue progression"""
+    __slots__ = ('parsed_sprints', 'sprints_by_name', 'work_start', 'work_end', 'current_status',
+                 'last_in_progress_start', 'pending_duration', 'pending_start', 'start_sprint', 'end_sprint',
+                 'was_resolved', 'sprint_assignments', 'sprint_removals')
+
     def __init__(self, parsed_sprints: List[Dict[str, Any]]) -> None:
         self.parsed_sprints: List[Dict[str, Any]] = parsed_sprints
+        self.sprints_by_name: Dict[Optional[str], Dict[str, Any]] = {}
+        for sprint in parsed_sprints:
+            self.sprints_by_name.setdefault(sprint.get('name'), sprint)
         self.work_start: Optional[datetime] = None
         self.work_end: Optional[datetime] = None
         self.current_status: Optional[str] = None
@@ -27,35 +45,49 @@ class IssueState:
 
     def handle_status_change(self, event: StatusEvent) -> None:
         """Process a status change event"""
-        if event.to_status == "In Progress":
-            if self.work_start is None:
-                self.work_start = event.timestamp
-                self.start_sprint = event.sprint or ""
-            self.last_in_progress_start = event.timestamp
-
-            # Check if this transition happened in a closed sprint (for legacy compatibility)
-            sprint_info = next((s for s in self.parsed_sprints if s.get('name') == event.sprint), None)
-            if sprint_info and sprint_info.get('state') == 'CLOSED':
-                self.was_resolved = True  # Treat work in closed sprint as resolved
-                # For closed sprint work, use the end date of the sprint as work_end if not already set
-                if self.work_end is None and sprint_info.get('completeDate'):
-                    self.work_end = sprint_info['completeDate']
-                elif self.work_end is None and sprint_info.get('endDate'):
-                    self.work_end = sprint_info['endDate']
-                self.end_sprint = event.sprint or ""
-
-        elif event.to_status == "Resolved":
-            self.work_end = event.timestamp
-            self.end_sprint = event.sprint or ""
-            self.was_resolved = True
-
-        elif event.to_status == "Pending":
-            self.pending_start = event.timestamp
+        handler = self.STATUS_HANDLERS.get(event.to_status)
+        if handler is not None:
+            handler(self, event)
         elif event.from_status == "Pending" and self.pending_start is not None:
             self.pending_duration += (event.timestamp - self.pending_start).total_seconds()
 
         self.current_status = event.to_status
 
+    def _enter_in_progress(self, event: StatusEvent) -> None:
+        """Handle a transition into In Progress"""
+        if self.work_start is None:
+            self.work_start = event.timestamp
+            self.start_sprint = event.sprint or ""
+        self.last_in_progress_start = event.timestamp
+
+        # Check if this transition happened in a closed sprint (for legacy compatibility)
+        sprint_info = self.sprints_by_name.get(event.sprint)
+        if sprint_info and sprint_info.get('state') == 'CLOSED':
+            self.was_resolved = True  # Treat work in closed sprint as resolved
+            # For closed sprint work, use the end date of the sprint as work_end if not already set
+            if self.work_end is None and sprint_info.get('completeDate'):
+                self.work_end = sprint_info['completeDate']
+            elif self.work_end is None and sprint_info.get('endDate'):
+                self.work_end = sprint_info['endDate']
+            self.end_sprint = event.sprint or ""
+
+    def _enter_resolved(self, event: StatusEvent) -> None:
+        """Handle a transition into Resolved"""
+        self.work_end = event.timestamp
+        self.end_sprint = event.sprint or ""
+        self.was_resolved = True
+
+    def _enter_pending(self, event: StatusEvent) -> None:
+        """Handle a transition into Pending"""
+        self.pending_start = event.timestamp
+
+    # Target status -> handler; any other target only closes a Pending period
+    STATUS_HANDLERS = {
+        "In Progress": _enter_in_progress,
+        "Resolved": _enter_resolved,
+        "Pending": _enter_pending
+    }
+
     def handle_sprint_change(self, event: SprintEvent) -> None:
         """Process a sprint assignment/removal event"""
         if event.action == "added":
@@ -78,13 +110,12 @@ class IssueState:
         if self.work_start is not None and self.work_end is not None:
             total_seconds = (self.work_end - self.work_start).total_seconds()
 
-            # Exclude weekends (exact logic as original calculate_cycle_time method)
-            weekend_seconds = 0
-            current_date = self.work_start
-            while current_date <= self.work_end:
-                if current_date.weekday() >= 5:  # Saturday (5) or Sunday (6)
-                    weekend_seconds += 24 * 60 * 60
-                current_date += timedelta(days=1)
+            # Exclude weekends: every day stepped from work_start up to work_end that lands on
+            # Saturday (5) or Sunday (6) counts as a full day, computed per week instead of per day
+            days = max(0, (self.work_end - self.work_start).days + 1)
+            full_weeks, remaining_days = divmod(days, 7)
+            weekend_days = full_weeks * 2 + _PARTIAL_WEEK_WEEKEND_DAYS[self.work_start.weekday()][remaining_days]
+            weekend_seconds = weekend_days * 24 * 60 * 60
 
             # Return result in seconds (matching original method)
             classification.cycle_time = max(0, total_seconds - weekend_seconds - self.pending_duration)
@@ -130,7 +161,7 @@ class IssueState:
             return False
 
         # Find sprint info and calculate midpoint
-        sprint_info = next((s for s in self.parsed_sprints if s.get('name') == self.start_sprint), None)
+        sprint_info = self.sprints_by_name.get(self.start_sprint)
         if not sprint_info or not sprint_info.get('startDate'):
             return False
 
@@ -148,87 +179,119 @@ class IssueClassifier:
     """Centralized issue classification logic"""
     def __init__(self, parsed_sprints: List[Dict[str, Any]]) -> None:
         self.parsed_sprints: List[Dict[str, Any]] = parsed_sprints
+        self._segment_starts: List[date] = []
+        self._segment_sprints: List[Optional[str]] = []
+        self._build_sprint_segments()
+
+    def _build_sprint_segments(self) -> None:
+        """Split the sprint calendar into date segments, each mapped to its active sprint"""
+        ranges = []
+        for sprint in self.parsed_sprints:
+            end_date = sprint.get("completeDate") or sprint.get("endDate")
+            if sprint.get("startDate") and end_date:
+                ranges.append((sprint["startDate"].date(), end_date.date(), sprint.get("name")))
+
+        boundaries = sorted({start for start, _, _ in ranges} | {end + timedelta(days=1) for _, end, _ in ranges})
+        for boundary in boundaries:
+            # Overlapping sprints resolve to the first one listed, as JIRA reports them
+            name = next((name for start, end, name in ranges if start <= boundary <= end), None)
+            self._segment_starts.append(boundary)
+            self._segment_sprints.append(name)
 
     def classify_issue(self, changelog_response: Dict[str, Any]) -> IssueClassification:
         """Single method that determines all metrics for an issue"""
         # Extract issue type
         issue_type = changelog_response["fields"]["issuetype"]["name"]
 
+        # Never started issues have no cycle time, sprint delivery or aging to report
+        if not self._has_work_transition(changelog_response):
+            return IssueClassification()
+
         # Extract timeline events
         events = self._extract_timeline_events(changelog_response)
 
         # Process events through state machine
         state = IssueState(self.parsed_sprints)
+        handlers = {
+            StatusEvent: state.handle_status_change,
+            SprintEvent: state.handle_sprint_change
+        }
         for event in events:
-            if isinstance(event, StatusEvent):
-                state.handle_status_change(event)
-            elif isinstance(event, SprintEvent):
-                state.handle_sprint_change(event)
+            handlers[type(event)](event)
 
         return state.get_final_classification(issue_type)
 
+    def _has_work_transition(self, changelog_response: Dict[str, Any]) -> bool:
+        """Check whether any status change moved the issue into In Progress or Resolved"""
+        return any(item["field"] == "status" and item.get("toString") in _WORK_STATUSES
+                   for history in changelog_response["changelog"]["histories"]
+                   for item in history["items"])
+
     def _extract_timeline_events(self, changelog_response: Dict[str, Any]) -> List[Event]:
         """Extract all relevant events in chronological order"""
         events = []
+        sprint_field = JIRA_CONFIG['SPRINT_CUSTOM_FIELD']
 
         for history in changelog_response["changelog"]["histories"]:
             if not history.get("created"):
                 continue
             try:
-                timestamp = datetime.strptime(history["created"], "%Y-%m-%dT%H:%M:%S.%f%z")
+                timestamp = datetime.fromisoformat(history["created"])
             except (ValueError, TypeError):
                 continue
 
             for item in history["items"]:
-                if item["field"] == "status":
-                    # Match to sprint at this timestamp
-                    sprint = self._get_sprint_at_time(timestamp)
+                field = item["field"]
+                if field == "status":
+                    to_status = sys.intern(item.get("toString") or "")
+                    # Match to sprint at this timestamp, only needed where the state machine reads it
+                    sprint = self.get_sprint_at_time(timestamp) if to_status in _WORK_STATUSES else None
                     events.append(StatusEvent(
                         timestamp=timestamp,
-                        from_status=item.get("fromString", ""),
-                        to_status=item.get("toString", ""),
+                        from_status=sys.intern(item.get("fromString") or ""),
+                        to_status=to_status,
                         sprint=sprint
                     ))
 
-                elif item["field"] == JIRA_CONFIG['SPRINT_CUSTOM_FIELD']:
+                elif field == sprint_field:
                     # Parse sprint changes
                     from_sprints = self._parse_sprint_list(item.get("fromString", ""))
                     to_sprints = self._parse_sprint_list(item.get("toString", ""))
 
-                    # Generate add/remove events
+                    # Generate add/remove events, diffing through sets but emitting in field order
+                    from_set = set(from_sprints)
+                    to_set = set(to_sprints)
                     for sprint in to_sprints:
-                        if sprint not in from_sprints:
+                        if sprint not in from_set:
                             events.append(SprintEvent(timestamp, "added", sprint))
 
                     for sprint in from_sprints:
-                        if sprint not in to_sprints:
+                        if sprint not in to_set:
                             events.append(SprintEvent(timestamp, "removed", sprint))
 
-        return sorted(events, key=lambda e: e.timestamp)
+        # Histories normally arrive in order, which an in-place stable sort handles in a single pass
+        events.sort(key=attrgetter('timestamp'))
+        return events
 
-    def _get_sprint_at_time(self, timestamp: datetime) -> Optional[str]:
+    def get_sprint_at_time(self, timestamp: datetime) -> Optional[str]:
         """Get the active sprint at a given timestamp"""
-        ts = timestamp
-        sprint = next((s for s in self.parsed_sprints
-                      if s.get("startDate") and (s.get("completeDate") or s.get("endDate")) and
-                      s["startDate"].date() <= ts.date() <= (s.get("completeDate") or s["endDate"]).date()), None)
-        return sprint["name"] if sprint else None
+        index = bisect_right(self._segment_starts, timestamp.date()) - 1
+        return self._segment_sprints[index] if index >= 0 else None
 
     def _parse_sprint_list(self, sprint_string: str) -> List[str]:
         """Parse sprint names from comma-separated string"""
         if not sprint_string:
             return []
+        if 'name=' in sprint_string:
+            sprint_names = []
+            for sprint in split_sprints(sprint_string):
+                name = parse_sprint_fields(sprint).get('name')
+                if name is not None:
+                    sprint_names.append(sys.intern(name))
+            return sprint_names
         sprint_names = []
         for part in sprint_string.split(','):
             part = part.strip()
-            if 'name=' in part:
-                name_start = part.find('name=') + 5
-                name_end = part.find(',', name_start)
-                if name_end == -1:
-                    name_end = part.find(']', name_start)
-                if name_end == -1:
-                    name_end = len(part)
-                sprint_names.append(part[name_start:name_end].strip())
-            elif part and not part.startswith('['):
-                sprint_names.append(part)
-        return sprint_names
\ No newline at end of file
+            if part and not part.startswith('['):
+                sprint_names.append(sys.intern(part))
+        return sprint_names
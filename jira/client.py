@@ -4,29 +4,91 @@ JIRA HTTP client and API operations
 
 import asyncio
 from datetime import datetime, timedelta, timezone
-import os
-from typing import Dict, List, Any, Optional
+import functools
+import random
+import shutil
+import sys
+from typing import Dict, List, Any, Optional, Tuple
 
 import httpx
+import orjson
 
 from .models import IssueInfo
 from .classifier import IssueClassifier
 from .debug import DebugManager
+from .rate_limiter import RateLimiter
+from .sprint_fields import parse_sprint_fields
 from utils import JIRA_CONFIG
 from sqlite_manager import SQLiteManager
 
+# Rate limiting and transient server errors; any other error status fails immediately
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+async def _gather_or_cancel(*aws: Any) -> List[Any]:
+    """Like asyncio.gather, but cancels and awaits the remaining tasks as soon as one fails"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # Siblings would otherwise keep using a client that is being closed, and their errors go unretrieved
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_sprint_string(sprint_string: str) -> Dict[str, Any]:
+    """Parse a sprint custom field value; identical strings recur across issues so results are memoized"""
+    info = parse_sprint_fields(sprint_string)
+    for key in ('name', 'state'):
+        if key in info:
+            info[key] = sys.intern(info[key])
+
+    if info['state'] == "FUTURE":
+        info['startDate'] = info['endDate'] = None
+    else:
+        for date_field in ['startDate', 'endDate', 'completeDate']:
+            # JIRA serializes unset dates as "<null>"; skip them without raising
+            if info.get(date_field) and info[date_field] != "<null>":
+                try:
+                    parsed = datetime.fromisoformat(info[date_field])
+                except (ValueError, TypeError):
+                    info[date_field] = None
+                else:
+                    # Convert offsets to UTC rather than relabelling them; values without one are taken as UTC
+                    info[date_field] = (parsed.replace(tzinfo=timezone.utc) if parsed.tzinfo is None
+                                        else parsed.astimezone(timezone.utc))
+            else:
+                info[date_field] = None
+
+    return info
+
 
 class JiraTools:
     """Class that handles everything JIRA"""
-    def __init__(self, token: str, url: str, proxies: Optional[str], debug: bool, max_concurrency: Optional[int] = None):
+    def __init__(self, token: str, url: str, proxies: Optional[str], debug: bool, *,
+                 max_concurrency: Optional[int] = None, rate_limit: Optional[float] = None):
         self.token = token
         self.url = url
         self.proxies = proxies
         self.debug = debug
         self.max_concurrency = max_concurrency or JIRA_CONFIG['DEFAULT_CONCURRENCY']
         self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Optional cap on requests per second; pacing requests up front is cheaper than retrying 429s
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
+        self._client: Optional[httpx.AsyncClient] = None
         self.sqlite_manager = SQLiteManager()
+        self._store_buffer: List[Tuple[str, Dict[str, Any], Optional[str]]] = []
+        self._prefetched_issues: Dict[str, Dict[str, Any]] = {}
+        # Only the fields read while classifying are requested from JIRA
+        self.issue_fields = ['issuetype', JIRA_CONFIG['SPRINT_CUSTOM_FIELD'], JIRA_CONFIG['STORY_POINTS_CUSTOM_FIELD']]
+        # Issues resolved before this are unlikely to be reopened and can be cached; days-level precision suffices for a run
+        self._storage_cutoff = datetime.now(timezone.utc) - timedelta(days=JIRA_CONFIG['DB_STORAGE_BUFFER_DAYS'])
         self.debug_manager = DebugManager(debug)
+        # Width used to blank the progress line; read once and falls back to 80 columns off a terminal
+        self._terminal_width = shutil.get_terminal_size().columns
 
     def store_debug_info(self, issue: str, data: Dict[str, Any]) -> None:
         """Saves debug info to disk (level 2 debug) - overwrites existing files"""
@@ -40,37 +102,83 @@ class JiraTools:
         """Append issue key to appropriate debug file (level 1 debug)"""
         self.debug_manager.append_debug_issue(issue_key, is_delivered)
 
+    async def flush_stored_issues(self) -> None:
+        """Write buffered issues to the SQLite cache in a single transaction"""
+        if self._store_buffer:
+            issues, self._store_buffer = self._store_buffer, []
+            await asyncio.to_thread(self.sqlite_manager.store_issues, issues)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazily create the HTTP client shared by all requests"""
+        if self._client is None:
+            # HTTP/2 multiplexes concurrent requests over the pooled connections; falls back to HTTP/1.1 if unsupported
+            self._client = httpx.AsyncClient(
+                http2=True,
+                proxy=self.proxies,
+                timeout=JIRA_CONFIG['REQUEST_TIMEOUT'],
+                limits=httpx.Limits(max_connections=self.max_concurrency * 2,
+                                    max_keepalive_connections=self.max_concurrency),
+                headers={
+                    'Content-Type': 'application/json',
+                    'Authorization': f'Bearer {self.token}'
+                }
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Flush buffered cache writes, then close the SQLite cache, the shared HTTP client and any open debug files"""
+        await self.flush_stored_issues()
+        await asyncio.to_thread(self.sqlite_manager.close)
+        self.debug_manager.close()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> 'JiraTools':
+        """Use the client as an async context manager"""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Release everything held by the client"""
+        await self.aclose()
+
     async def jira_request(self, url: str, method: str = 'GET', data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Generic function to call JIRA APIs"""
-        retries = JIRA_CONFIG['RETRY_COUNT_MULTIPLIER'] * self.max_concurrency
+        retries = JIRA_CONFIG['RETRY_COUNT']
         async with self.semaphore:
-            headers = {
-                'Content-Type': 'application/json',
-                'Authorization': f'Bearer {self.token}'
-            }
-            async with httpx.AsyncClient(proxy=self.proxies, timeout=JIRA_CONFIG['REQUEST_TIMEOUT']) as client:
-                for attempt in range(retries):
-                    try:
-                        response = await client.request(
-                            method,
-                            url,
-                            json=data,
-                            headers=headers
-                        )
-
-                        response.raise_for_status()
-                        return response.json()
-
-                    except httpx.HTTPStatusError as exc:
-                        if attempt >= retries - 1:
-                            raise
-
-                        print("\r" + " " * os.get_terminal_size()[0], end="", flush=True)
-                        print(f"\rRetrying after error {exc.response.status_code}...", end="", flush=True)
-                        await asyncio.sleep(JIRA_CONFIG['RETRY_DELAY'])
-
-                # If we've exhausted all retries without success, raise a more specific error
-                raise httpx.RequestError("All retry attempts failed")
+            client = self._get_client()
+            for attempt in range(retries):
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire()
+                try:
+                    response = await client.request(
+                        method,
+                        url,
+                        json=data
+                    )
+
+                    response.raise_for_status()
+                    return orjson.loads(response.content)
+
+                except httpx.HTTPStatusError as exc:
+                    if exc.response.status_code not in _RETRYABLE_STATUS_CODES or attempt >= retries - 1:
+                        raise
+
+                    print("\r" + " " * self._terminal_width, end="", flush=True)
+                    print(f"\rRetrying after error {exc.response.status_code}...", end="", flush=True)
+                    await asyncio.sleep(self._retry_delay(exc.response, attempt))
+
+            # If we've exhausted all retries without success, raise a more specific error
+            raise httpx.RequestError("All retry attempts failed")
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Seconds to wait before retrying, honoring JIRA's Retry-After header when present"""
+        retry_after = response.headers.get('Retry-After', '')
+        if retry_after.isdigit():
+            return float(retry_after)
+        # Jitter spreads out concurrent requests that failed together so they don't retry in lockstep
+        backoff = min(JIRA_CONFIG['RETRY_BACKOFF_BASE'] * 2 ** attempt, JIRA_CONFIG['RETRY_DELAY'])
+        return backoff + random.uniform(0, JIRA_CONFIG['RETRY_JITTER'])
 
     async def get_all_issues(self, project_key: str, teams: str, skew: int, interval: int, custom_jql: str) -> List[Dict[str, Any]]:
         """Get all issues for a specific project, partitioned by month"""
@@ -90,17 +198,23 @@ class JiraTools:
             # No date filtering, use single query
             monthly_partitions = [None]
 
-        # Fetch issues for each monthly partition
+        # Fetch all monthly partitions concurrently; jira_request's semaphore bounds the requests in flight
         total_partitions = len(monthly_partitions)
-        for i, month_filter in enumerate(monthly_partitions, 1):
-            if total_partitions >= 1:
-                month_display = month_filter['month_key'] if month_filter else 'all'
-                print(f"\rFetching issues for {month_display} [{i}/{total_partitions}]...", end="", flush=True)
+        completed_partitions = 0
 
+        async def fetch_partition(month_filter: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            nonlocal completed_partitions
+            month_display = month_filter['month_key'] if month_filter else 'all'
             month_issues = await self.get_issues_for_month(project_key, teams, custom_jql, month_filter)
             # Add month info to each issue for tracking
             for issue in month_issues:
-                issue['query_month'] = month_filter['month_key'] if month_filter else 'all'
+                issue['query_month'] = month_display
+
+            completed_partitions += 1
+            print(f"\rFetched issues for {month_display} [{completed_partitions}/{total_partitions}]...", end="", flush=True)
+            return month_issues
+
+        for month_issues in await _gather_or_cancel(*(fetch_partition(month_filter) for month_filter in monthly_partitions)):
             issues_combo.extend(month_issues)
 
         # Clear the progress line after completion
@@ -113,19 +227,12 @@ class JiraTools:
     def generate_monthly_partitions(self, start_month: int, end_month: int) -> List[Dict[str, Any]]:
         """Generate monthly partition filters"""
         partitions = []
+        now = datetime.now(timezone.utc)
+        current_month_index = now.year * 12 + now.month - 1
         for month_offset in range(start_month, end_month - 1, -1):
             # Calculate the year and month for this offset
-            now = datetime.now(timezone.utc)
-            target_year = now.year
-            target_month = now.month - month_offset
-
-            # Handle year rollover
-            while target_month <= 0:
-                target_month += 12
-                target_year -= 1
-            while target_month > 12:
-                target_month -= 12
-                target_year += 1
+            target_year, target_month_index = divmod(current_month_index - month_offset, 12)
+            target_month = target_month_index + 1
 
             month_key = f"{target_year}-{target_month:02d}"
             partitions.append({
@@ -148,74 +255,97 @@ class JiraTools:
         if teams != "":
             teams_str = f" AND Team in ({teams})"
 
-        start_at = 0
-        total = 1
-
         jql = ""
         if custom_jql != "":
             jql = f"{custom_jql}{teams_str}{skew_str}"
         else:
             jql = f"project={project_key} AND type in (Story, Defect, Bug, Task) AND assignee is not EMPTY{teams_str}{skew_str}"
 
-        while start_at < total:
-            response = await self.jira_request(issues_url,
-                                    'POST',
-                                    data={
-                                        'jql': jql,
-                                        'maxResults': JIRA_CONFIG['MAX_RESULTS'],
-                                        'startAt': start_at,
-                                        'fields': [
-                                            'key'
-                                        ]
-                                    })
-
-            total = response['total']
-            start_at += JIRA_CONFIG['MAX_RESULTS']
-
-            issues_combo = issues_combo + response['issues']
+        search_data = {
+            'jql': jql,
+            'maxResults': JIRA_CONFIG['MAX_RESULTS'],
+            'fields': ['key', 'updated', *self.issue_fields],
+            'expand': ['changelog']
+        }
+
+        # The first page tells how many issues match; the remaining pages are then requested concurrently
+        response = await self.jira_request(issues_url, 'POST', data={**search_data, 'startAt': 0})
+        # JIRA may cap the page size below MAX_RESULTS when expanding changelogs
+        page_size = response.get('maxResults') or JIRA_CONFIG['MAX_RESULTS']
+        pages = [response]
+        pages.extend(await _gather_or_cancel(*(
+            self.jira_request(issues_url, 'POST', data={**search_data, 'startAt': start_at})
+            for start_at in range(page_size, response['total'], page_size)
+        )))
+
+        for page in pages:
+            for issue in page['issues']:
+                self._prefetch_issue(issue)
+            issues_combo.extend(page['issues'])
 
         return issues_combo
 
+    def _prefetch_issue(self, issue: Dict[str, Any]) -> None:
+        """Keep the changelog returned by the search aside, leaving only the key and update time on the issue"""
+        fields = issue.pop('fields', None)
+        changelog = issue.pop('changelog', None)
+        if fields is None:
+            return
+
+        # Used to validate SQLite cache entries for this issue
+        issue['updated'] = fields.pop('updated', None)
+        if changelog is None:
+            return
+
+        # Search results truncate long changelogs; those issues are fetched individually instead
+        if len(changelog.get('histories', [])) < changelog.get('total', 0):
+            return
+
+        if self.debug < 2:
+            # Held until the issue is classified, so keep only what the classifier reads (level 2 debug dumps everything)
+            changelog = {'histories': self._relevant_histories(changelog['histories'])}
+
+        self._prefetched_issues[issue['key']] = {'key': issue['key'], 'fields': fields, 'changelog': changelog}
+
+    def _relevant_histories(self, histories: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Reduce changelog histories to their timestamp and status/sprint items, dropping authors and other fields"""
+        relevant_fields = ('status', JIRA_CONFIG['SPRINT_CUSTOM_FIELD'])
+        trimmed = []
+        for history in histories:
+            items = [item for item in history.get('items', []) if item.get('field') in relevant_fields]
+            if items:
+                trimmed.append({'created': history.get('created'), 'items': items})
+        return trimmed
+
     def parse_sprint_string(self, sprint_string: str) -> Dict[str, Any]:
         """Parsing the custom field that contains sprint information"""
-        info = {}
-        for part in sprint_string.strip('[]').split(','):
-            if '=' in part:
-                k, v = part.split('=', 1)
-                info[k.strip()] = v.strip()
-
-        if info['state'] == "FUTURE":
-            info['startDate'] = info['endDate'] = None
-        else:
-            for date_field in ['startDate', 'endDate', 'completeDate']:
-                if info.get(date_field):
-                    try:
-                        info[date_field] = datetime.strptime(info[date_field], "%Y-%m-%dT%H:%M:%S.%fZ").replace(tzinfo=timezone.utc)
-                    except (ValueError, TypeError):
-                        info[date_field] = None
-                else:
-                    info[date_field] = None
-
-        return info
+        # Copy so callers never mutate the memoized result shared across issues
+        return dict(_parse_sprint_string(sprint_string))
 
     async def check_issue_resolution_in_sprint(self, iss: Dict[str, Any]) -> IssueInfo:
         """Validates if issue was solved in the sprint using simplified classifier"""
         issue_info = IssueInfo(key=iss["key"], valid=False, query_month=iss.get('query_month'))
 
-        # Check if issue exists in SQLite first
-        changelog_response = self.sqlite_manager.get_issue(iss["key"])
-        from_database = True
+        # Prefer the changelog fetched with the search results; it is already in memory and released once used
+        changelog_response = self._prefetched_issues.pop(iss["key"], None)
+        prefetched = changelog_response is not None
+        from_database = False
+
+        if changelog_response is None:
+            # Fall back to the SQLite cache, validated against the issue's update time
+            changelog_response = await asyncio.to_thread(self.sqlite_manager.get_issue, iss["key"], iss.get('updated'))
+            from_database = changelog_response is not None
 
         if changelog_response is None:
-            # Issue not in database, make API call
-            changelog_url = f'{self.url}/issue/{iss["key"]}?expand=changelog'
+            # Neither prefetched nor cached, make API call
+            changelog_url = f'{self.url}/issue/{iss["key"]}?expand=changelog&fields={",".join(self.issue_fields)}'
             changelog_response = await self.jira_request(changelog_url)
-            from_database = False
 
         if self.debug >= 2:
             self.store_debug_info(iss["key"], changelog_response)
 
-        sprints_raw = changelog_response["fields"].get(JIRA_CONFIG['SPRINT_CUSTOM_FIELD'], [])
+        fields = changelog_response["fields"]
+        sprints_raw = fields.get(JIRA_CONFIG['SPRINT_CUSTOM_FIELD'], [])
         if sprints_raw is None:
             return issue_info
 
@@ -230,25 +360,25 @@ class JiraTools:
         # Only store issues completed more than DB_STORAGE_BUFFER_DAYS ago to avoid storing issues that might be reopened
         if (not from_database and
             classification.work_end is not None and
-            classification.work_end < datetime.now(timezone.utc) - timedelta(days=JIRA_CONFIG['DB_STORAGE_BUFFER_DAYS'])):
+            classification.work_end < self._storage_cutoff):
             # Use end_sprint from classification for storage
-            end_sprint = ""
-            for sprint in parsed_sprints:
-                end_date = sprint.get("completeDate") or sprint.get("endDate")
-                if (sprint.get("startDate") and end_date and
-                    sprint["startDate"].date() <= classification.work_end.date() <= end_date.date()):
-                    end_sprint = sprint.get("name", "")
-                    break
+            end_sprint = classifier.get_sprint_at_time(classification.work_end)
 
             if end_sprint and end_sprint != "":
-                self.sqlite_manager.store_issue(iss["key"], changelog_response)
+                # Prefetched payloads are usually already cached from an earlier run
+                already_stored = prefetched and await asyncio.to_thread(
+                    self.sqlite_manager.has_issue, iss["key"], iss.get('updated'))
+                if not already_stored:
+                    self._store_buffer.append((iss["key"], changelog_response, iss.get('updated')))
+                    if len(self._store_buffer) >= JIRA_CONFIG['DB_STORE_BATCH_SIZE']:
+                        await self.flush_stored_issues()
 
         # Get story points
-        story_points = changelog_response["fields"].get(JIRA_CONFIG['STORY_POINTS_CUSTOM_FIELD'], 1.0)
+        story_points = fields.get(JIRA_CONFIG['STORY_POINTS_CUSTOM_FIELD'], 1.0)
         if story_points is None:
             story_points = 1.0
 
-        issue_type = changelog_response["fields"]["issuetype"]["name"]
+        issue_type = fields["issuetype"]["name"]
 
         # Populate IssueInfo from classification
         if classification.valid:
@@ -2,9 +2,12 @@
 JIRA debug utilities and file operations
 """
 
-import json
 import os
-from typing import Dict, Any
+import queue
+import threading
+from typing import Dict, Any, Optional, TextIO, Tuple
+
+import orjson
 
 from utils import JIRA_CONFIG
 
@@ -15,13 +18,28 @@ class DebugManager:
     def __init__(self, debug_level: int):
         self.debug_level = debug_level
         self.debug_files_cleaned = False
+        self._delivered_fp: Optional[TextIO] = None
+        self._carryover_fp: Optional[TextIO] = None
+        self._write_queue: "queue.Queue[Optional[Tuple[str, bytes]]]" = queue.Queue()
+        self._writer_thread: Optional[threading.Thread] = None
 
     def store_debug_info(self, issue: str, data: Dict[str, Any]) -> None:
         """Saves debug info to disk (level 2 debug) - overwrites existing files"""
+        if self._writer_thread is None:
+            os.makedirs(JIRA_CONFIG['DEBUG_DIR'], exist_ok=True)
+            self._writer_thread = threading.Thread(target=self._drain_write_queue, daemon=True)
+            self._writer_thread.start()
+
+        # Serialize now so later changes to data don't leak into the dump; the write happens in the background
+        self._write_queue.put((issue, orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)))
+
+    def _drain_write_queue(self) -> None:
+        """Write queued debug dumps to disk until the stop marker is received"""
         debug_dir = JIRA_CONFIG['DEBUG_DIR']
-        os.makedirs(debug_dir, exist_ok=True)
-        with open(f"{debug_dir}/{issue}.json", "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        while (item := self._write_queue.get()) is not None:
+            issue, payload = item
+            with open(f"{debug_dir}/{issue}.json", "wb") as f:
+                f.write(payload)
 
     def clean_debug_files(self) -> None:
         """Clean debug files before starting new run (level 1 debug)"""
@@ -39,11 +57,33 @@ class DebugManager:
 
             self.debug_files_cleaned = True
 
+    def _get_debug_file(self, is_delivered: bool) -> TextIO:
+        """Open the delivered/carryover debug file once and keep it open for the run"""
+        # The handles outlive this call on purpose and are closed in close()
+        # pylint: disable=consider-using-with
+        if is_delivered:
+            if self._delivered_fp is None:
+                self._delivered_fp = open(f"{JIRA_CONFIG['DEBUG_DIR']}/{JIRA_CONFIG['DEBUG_DELIVERED_FILE']}", "a", encoding="utf-8")
+            return self._delivered_fp
+
+        if self._carryover_fp is None:
+            self._carryover_fp = open(f"{JIRA_CONFIG['DEBUG_DIR']}/{JIRA_CONFIG['DEBUG_CARRYOVER_FILE']}", "a", encoding="utf-8")
+        return self._carryover_fp
+
     def append_debug_issue(self, issue_key: str, is_delivered: bool) -> None:
         """Append issue key to appropriate debug file (level 1 debug)"""
         if self.debug_level >= 1:
             self.clean_debug_files()
-            debug_dir = JIRA_CONFIG['DEBUG_DIR']
-            filename = JIRA_CONFIG['DEBUG_DELIVERED_FILE'] if is_delivered else JIRA_CONFIG['DEBUG_CARRYOVER_FILE']
-            with open(f"{debug_dir}/{filename}", "a", encoding="utf-8") as f:
-                f.write(f"{issue_key}\n")
\ No newline at end of file
+            self._get_debug_file(is_delivered).write(f"{issue_key}\n")
+
+    def close(self) -> None:
+        """Finish pending debug dumps, then flush and close the delivered/carryover debug files"""
+        if self._writer_thread is not None:
+            self._write_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
+
+        for fp in (self._delivered_fp, self._carryover_fp):
+            if fp is not None:
+                fp.close()
+        self._delivered_fp = self._carryover_fp = None
@@ -8,6 +8,9 @@ from typing import Optional, Union
 
 class IssueInfo:
     """Class to return issue info"""
+    __slots__ = ('key', 'delivered_in_sprint', 'story_points', 'issue_type', 'cycle_time', 'valid',
+                 'in_progress_days', 'is_aged', 'query_month', 'removed_before_midpoint')
+
     def __init__(self, key: Optional[str] = None, delivered_in_sprint: Optional[bool] = None,
                  story_points: Optional[Union[int, float]] = None, issue_type: Optional[str] = None,
                  cycle_time: Optional[Union[int, float]] = None, valid: bool = True,
@@ -27,12 +30,16 @@ class IssueInfo:
 
 class Event:
     """Base class for timeline events"""
+    __slots__ = ('timestamp',)
+
     def __init__(self, timestamp: datetime) -> None:
         self.timestamp: datetime = timestamp
 
 
 class StatusEvent(Event):
     """Represents a status transition event"""
+    __slots__ = ('from_status', 'to_status', 'sprint')
+
     def __init__(self, timestamp: datetime, from_status: str, to_status: str, sprint: Optional[str] = None) -> None:
         super().__init__(timestamp)
         self.from_status: str = from_status
@@ -42,6 +49,8 @@ class StatusEvent(Event):
 
 class SprintEvent(Event):
     """Represents a sprint assignment/removal event"""
+    __slots__ = ('action', 'sprint')
+
     def __init__(self, timestamp: datetime, action: str, sprint: str) -> None:
         super().__init__(timestamp)
         self.action: str = action  # 'added' or 'removed'
@@ -50,6 +59,10 @@ class SprintEvent(Event):
 
 class IssueClassification:
     """Result of issue classification with all metrics"""
+    __slots__ = ('should_exclude', 'delivered_in_sprint', 'removed_before_midpoint', 'cycle_time',
+                 'in_progress_days', 'is_aged', 'valid', 'work_start', 'work_end', 'current_status',
+                 'last_in_progress_start', 'pending_duration')
+
     def __init__(self) -> None:
         self.should_exclude: bool = False
         self.delivered_in_sprint: bool = False
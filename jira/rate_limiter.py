@@ -0,0 +1,37 @@
+"""
+Client-side rate limiting for JIRA requests
+"""
+
+import asyncio
+import math
+import time
+
+
+class RateLimiter:
+    """Token bucket that spaces requests out to stay under JIRA's rate limit"""
+
+    def __init__(self, rate: float):
+        if math.isnan(rate) or rate <= 0:
+            raise ValueError(f"Rate limit must be greater than zero, got {rate}")
+        self.rate = rate
+        # Allow bursts of up to one second's worth of requests
+        self.capacity = max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent"""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            # Hold the lock while waiting so queued requests are released in order
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 0
+            self.updated = time.monotonic()
@@ -0,0 +1,35 @@
+"""
+Parsing helpers for serialized JIRA sprint values
+"""
+
+import re
+from typing import Dict, List
+
+# Separates key=value pairs in a serialized sprint; values may themselves contain commas or brackets
+SPRINT_FIELD_SEPARATOR_RE = re.compile(r',(?=\w+=)')
+
+# Separates serialized sprints listed in one string, e.g. "...Sprint@1a2b[...],...Sprint@3c4d[...]"
+SPRINT_OBJECT_SEPARATOR_RE = re.compile(r',\s*(?=[\w.$]+@\w+\[)')
+
+
+def parse_sprint_fields(sprint_string: str) -> Dict[str, str]:
+    """Split a single serialized sprint into its key=value fields"""
+    # Fields sit between the opening '[' and the last ']'; sprint names and goals may contain brackets and commas
+    start = sprint_string.find('[')
+    if 0 <= start < sprint_string.find('='):
+        end = sprint_string.rfind(']')
+        body = sprint_string[start + 1:end] if end > start else sprint_string[start + 1:]
+    else:
+        body = sprint_string
+
+    fields = {}
+    for part in SPRINT_FIELD_SEPARATOR_RE.split(body):
+        if '=' in part:
+            key, value = part.split('=', 1)
+            fields[key.strip()] = value.strip()
+    return fields
+
+
+def split_sprints(sprint_string: str) -> List[str]:
+    """Split a string holding several serialized sprints into one string per sprint"""
+    return SPRINT_OBJECT_SEPARATOR_RE.split(sprint_string)
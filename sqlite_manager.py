@@ -1,9 +1,10 @@
 """SQLite manager for storing JIRA issue changelog data."""
 
 import sqlite3
-import json
+import threading
 import lz4.frame
-from typing import Dict, Any, Optional
+import orjson
+from typing import Dict, Any, List, Optional, Tuple
 
 
 class SQLiteManager:
@@ -12,18 +13,55 @@ class SQLiteManager:
     def __init__(self, db_path: str = "jira_issues.db"):
         """Initialize SQLite manager with database path."""
         self.db_path = db_path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._ensure_database_exists()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening one tuned for cache writes on first use.
+
+        Cache lookups run on worker threads and SQLite connections are bound to the thread
+        that opened them, so each thread keeps its own. Reusing it also keeps sqlite3's
+        prepared statement cache warm across calls.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Only the owning thread uses it, but close() may run on another thread
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by this manager, checkpointing the WAL file."""
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            # Threads that use the manager again afterwards open fresh connections
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
     def _ensure_database_exists(self):
         """Create database and table if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS issue_changelog (
                     issue_key TEXT PRIMARY KEY,
-                    api_payload TEXT NOT NULL
+                    api_payload TEXT NOT NULL,
+                    updated TEXT
                 )
             """)
+
+            # Databases created before the updated column existed get it added; their rows
+            # have no timestamp and are refreshed the first time they are validated
+            cursor.execute("PRAGMA table_info(issue_changelog)")
+            if 'updated' not in [column[1] for column in cursor.fetchall()]:
+                cursor.execute("ALTER TABLE issue_changelog ADD COLUMN updated TEXT")
             conn.commit()
 
     def _compress_payload(self, api_payload: Dict[str, Any]) -> bytes:
@@ -35,8 +73,7 @@ class SQLiteManager:
         Returns:
             Compressed payload as bytes
         """
-        payload_json = json.dumps(api_payload)
-        return lz4.frame.compress(payload_json.encode('utf-8'))
+        return lz4.frame.compress(orjson.dumps(api_payload))
 
     def _decompress_payload(self, compressed_data: bytes) -> Dict[str, Any]:
         """Decompress API payload using LZ4.
@@ -47,49 +84,69 @@ class SQLiteManager:
         Returns:
             Decompressed API payload dict
         """
-        decompressed_json = lz4.frame.decompress(compressed_data).decode('utf-8')
-        return json.loads(decompressed_json)
+        return orjson.loads(lz4.frame.decompress(compressed_data))
 
-    def store_issue(self, issue_key: str, api_payload: Dict[str, Any]) -> bool:
-        """Store issue in database only if it has an end_sprint.
+    def store_issues(self, issues: List[Tuple[str, Dict[str, Any], Optional[str]]]) -> int:
+        """Store several issues in a single transaction.
 
         Args:
-            issue_key: JIRA issue key (e.g., 'PROJ-123')
-            api_payload: Complete API response from the changelog request
-            end_sprint: The end sprint identifier
+            issues: (issue_key, api_payload, updated) tuples to store
 
         Returns:
-            True if stored, False if not stored (no end_sprint)
+            Number of issues stored
         """
-        compressed_payload = self._compress_payload(api_payload)
-
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO issue_changelog (issue_key, api_payload)
-                VALUES (?, ?)
-            """, (issue_key, compressed_payload))
+        rows = [(issue_key, self._compress_payload(api_payload), updated) for issue_key, api_payload, updated in issues]
+        if not rows:
+            return 0
+
+        with self._connect() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO issue_changelog (issue_key, api_payload, updated)
+                VALUES (?, ?, ?)
+            """, rows)
             conn.commit()
 
-        return True
+        return len(rows)
 
-    def get_issue(self, issue_key: str) -> Optional[Dict[str, Any]]:
+    def get_issue(self, issue_key: str, updated: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """Retrieve issue payload from database.
 
         Args:
             issue_key: JIRA issue key
+            updated: Current JIRA 'updated' timestamp; when given, entries stored
+                for a different timestamp are treated as stale
 
         Returns:
-            API payload dict if found, None otherwise
+            API payload dict if found and up to date, None otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.cursor()
             cursor.execute("""
-                SELECT api_payload FROM issue_changelog WHERE issue_key = ?
+                SELECT api_payload, updated FROM issue_changelog WHERE issue_key = ?
             """, (issue_key,))
 
             result = cursor.fetchone()
-            if result:
+            if result and (updated is None or result[1] == updated):
                 return self._decompress_payload(result[0])
             return None
 
+
+    def has_issue(self, issue_key: str, updated: Optional[str] = None) -> bool:
+        """Check whether an up-to-date payload is already stored for an issue.
+
+        Args:
+            issue_key: JIRA issue key
+            updated: Current JIRA 'updated' timestamp; when given, entries stored
+                for a different timestamp do not count
+
+        Returns:
+            True if a matching entry exists, False otherwise
+        """
+        with self._connect() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT updated FROM issue_changelog WHERE issue_key = ?
+            """, (issue_key,))
+
+            result = cursor.fetchone()
+            return result is not None and (updated is None or result[0] == updated)
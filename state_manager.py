@@ -159,19 +159,12 @@ class State:
         print()
         print(colorize_metric_value("Average cycle time:", 'header'))
         for k, v in self.cycle_time_per_type.items():
-            values = numpy.array([item[1] for item in v])
-            argmax = numpy.argmax(values)
-            argmin = numpy.argmin(values)
-
-            average = numpy.mean(values)
-            top_1 = numpy.percentile(values, 99)
-            bottom_1 = numpy.percentile(values, 1)
-            std_dev = numpy.std(values)
-
-            print(f"{colorize_metric_value(k, 'info')} ({colorize_metric_value(len(values), 'count')}): {colorize_metric_value(seconds_to_pretty(float(average)), 'time')}")
-            print(f"    Top 1% [{colorize_issue_key(v[argmax][0])}]: {colorize_metric_value(seconds_to_pretty(float(top_1)), 'time')}")
-            print(f"    Bottom 1% [{colorize_issue_key(v[argmin][0])}]: {colorize_metric_value(seconds_to_pretty(float(bottom_1)), 'time')}")
-            print(f"    Std. Deviation: {colorize_metric_value(seconds_to_pretty(float(std_dev)), 'time')}")
+            stats = self.get_cycle_time_stats(v)
+
+            print(f"{colorize_metric_value(k, 'info')} ({colorize_metric_value(stats['count'], 'count')}): {colorize_metric_value(seconds_to_pretty(stats['average']), 'time')}")
+            print(f"    Top 1% [{colorize_issue_key(stats['max_key'])}]: {colorize_metric_value(seconds_to_pretty(stats['top_1']), 'time')}")
+            print(f"    Bottom 1% [{colorize_issue_key(stats['min_key'])}]: {colorize_metric_value(seconds_to_pretty(stats['bottom_1']), 'time')}")
+            print(f"    Std. Deviation: {colorize_metric_value(seconds_to_pretty(stats['std_dev']), 'time')}")
             print()
 
         print(colorize_metric_value("Average cycle time by Story Points:", 'header'))
@@ -179,15 +172,12 @@ class State:
         sorted_sp_keys = sorted(self.cycle_time_per_sp.keys(), key=lambda x: float('inf') if x == -1 else x)
 
         for sp_key in sorted_sp_keys:
-            v = self.cycle_time_per_sp[sp_key]
-            values = numpy.array([item[1] for item in v])
-            average = numpy.mean(values)
-            std_dev = numpy.std(values)
+            stats = self.get_cycle_time_stats(self.cycle_time_per_sp[sp_key])
 
             sp_display = f"{sp_key} SPs" if sp_key != -1 else "No SPs"
-            avg_time = colorize_metric_value(seconds_to_pretty(float(average)), 'time')
-            sd_time = colorize_metric_value(seconds_to_pretty(float(std_dev)), 'time')
-            print(f"{colorize_metric_value(sp_display, 'info')} ({colorize_metric_value(len(values), 'count')}): {avg_time} (SD: {sd_time})")
+            avg_time = colorize_metric_value(seconds_to_pretty(stats['average']), 'time')
+            sd_time = colorize_metric_value(seconds_to_pretty(stats['std_dev']), 'time')
+            print(f"{colorize_metric_value(sp_display, 'info')} ({colorize_metric_value(stats['count'], 'count')}): {avg_time} (SD: {sd_time})")
 
         print()
 
@@ -231,6 +221,20 @@ class State:
             print(f"  Trend (Issues): {issue_arrow}")
             print(f"  Trend (Story Points): {sp_arrow}")
 
+    def get_cycle_time_stats(self, items: List[List[Any]]) -> Dict[str, Any]:
+        """Summarize [issue_key, duration] pairs in a single vectorized pass over the durations"""
+        values = numpy.fromiter((item[1] for item in items), dtype=float, count=len(items))
+        bottom_1, top_1 = numpy.percentile(values, [1, 99])
+        return {
+            'count': len(items),
+            'average': float(values.mean()),
+            'std_dev': float(values.std()),
+            'top_1': float(top_1),
+            'bottom_1': float(bottom_1),
+            'max_key': items[int(values.argmax())][0],
+            'min_key': items[int(values.argmin())][0]
+        }
+
     def calculate_linear_trend(self, values: List[float]) -> float:
         """Calculate linear trend slope using numpy polyfit"""
         if len(values) < 2:
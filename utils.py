@@ -17,11 +17,16 @@ JIRA_CONFIG = {
     'DEBUG_DELIVERED_FILE': "delivered.txt",
     'DEBUG_CARRYOVER_FILE': "carryover.txt",
     'STATE_FILE': ".state",
+    'STATE_PERSIST_INTERVAL': 50,
     'DEFAULT_CONCURRENCY': 5,
+    'DEFAULT_RATE_LIMIT': None,
     'REQUEST_TIMEOUT': 60,
-    'RETRY_COUNT_MULTIPLIER': 3,
+    'RETRY_COUNT': 15,
     'RETRY_DELAY': 30,
-    'DB_STORAGE_BUFFER_DAYS': 14
+    'RETRY_BACKOFF_BASE': 2,
+    'RETRY_JITTER': 1,
+    'DB_STORAGE_BUFFER_DAYS': 14,
+    'DB_STORE_BATCH_SIZE': 100
 }
 
 AGING_THRESHOLDS = {